@@ -1,22 +1,54 @@
+import os
 from pathlib import Path
 
-from stable_baselines3 import DQN
 from stable_baselines3.common.env_util import make_vec_env
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import SubprocVecEnv
 
 from sot_autofish.game_fishing_env import GameFishingEnv
+from sot_autofish.logger_setup.logger_setup import LoggerSetup
+from sot_autofish.models.mixed_precision_dqn import MixedPrecisionDQN
 
-# Create and vectorize the environment
-env = make_vec_env(GameFishingEnv, n_envs=1)
+logger = LoggerSetup()
 
-script_path = Path(__file__).resolve()
-parent_folder = script_path.parent.parent
-log_folder = parent_folder / 'logs'
+# Keep 1 for live play (a single game window), use more for offline-replay training
+N_ENVS = int(os.getenv("N_ENVS", "1"))
 
-# Initialize the DQN model
-model = DQN("CnnPolicy", env, verbose=1, tensorboard_log=f"{log_folder}/fishing_tensorboard/")
 
-# Train the agent
-model.learn(total_timesteps=100000)
+def make_env(rank: int):
+    """Return a factory for a monitored environment, pinned to its own CPU core on Linux."""
+    def _init():
+        if hasattr(os, "sched_setaffinity"):
+            # Only cores in our cpuset are allowed, containers often restrict it
+            allowed = sorted(os.sched_getaffinity(0))
+            core = allowed[rank % len(allowed)]
+            try:
+                os.sched_setaffinity(0, {core})
+            except OSError as e:
+                logger.warning("Failed to pin env %d to core %d: %s", rank, core, e)
+        return Monitor(GameFishingEnv())
+    return _init
 
-# Save the trained model
-model.save("fishing_ai")
+
+if __name__ == "__main__":
+    # Create and vectorize the environment, stepping multiple envs in parallel subprocesses
+    if N_ENVS > 1:
+        env = SubprocVecEnv([make_env(rank) for rank in range(N_ENVS)])
+    else:
+        env = make_vec_env(GameFishingEnv, n_envs=1)
+
+    script_path = Path(__file__).resolve()
+    parent_folder = script_path.parent.parent
+    log_folder = parent_folder / 'logs'
+
+    # Initialize the DQN model, with BF16 Q-network forward passes on capable CUDA GPUs
+    model = MixedPrecisionDQN(
+        "CnnPolicy", env, verbose=1, tensorboard_log=f"{log_folder}/fishing_tensorboard/",
+        policy_kwargs={"normalize_images": True, "optimizer_kwargs": {"foreach": True}},
+    )
+
+    # Train the agent
+    model.learn(total_timesteps=100000)
+
+    # Save the trained model
+    model.save("fishing_ai")
@@ -1,18 +1,39 @@
 """Custom Gymnasium environment for Sea of Thieves fishing."""
+import queue
+import threading
+import time
+from typing import Optional
+
 import gymnasium as gym
 import numpy as np
 import cv2
 import mss
-import pyautogui
 from gymnasium import spaces
 
+from sot_autofish.game_interaction import GameInteraction
+from sot_autofish.logger_setup.logger_setup import LoggerSetup
+from sot_autofish.utils.frame_diff import absdiff_sum
+
+try:
+    import dxcam
+except ImportError:  # DXGI Desktop Duplication is only available on Windows
+    dxcam = None
+
+logger = LoggerSetup()
+
 
 class GameFishingEnv(gym.Env):
     """Custom environment for automating fishing in Sea of Thieves."""
-    def __init__(self):
+    _ACTION_KEYS = ('f', 'd', 'a', 's')
+    _ACTION_DELAY_S = 0.5  # Time the game gets to respond to an action
+
+    def __init__(self, game: Optional[GameInteraction] = None):
         super().__init__()
+        # Send inputs directly via SendInput, this also brings the game to the foreground
+        self._game = game if game is not None else GameInteraction("Sea of Thieves")
+
         # Define the action space: 0=F, 1=D, 2=A, 3=S
-        self.action_space = spaces.Discrete(4)
+        self.action_space = spaces.Discrete(len(self._ACTION_KEYS))
 
         # Observation space: Grayscale game screen (84x84)
         self.observation_space = spaces.Box(low=0, high=255, shape=(84, 84, 1), dtype=np.uint8)
@@ -20,66 +41,166 @@ class GameFishingEnv(gym.Env):
         # Screen capture region (adjust for your monitor/game resolution)
         self.monitor = {"top": 100, "left": 100, "width": 800, "height": 600}
         self.previous_frame = None  # To detect changes for rewards
+        self._prev_processed = None  # 84x84 gray version of previous_frame
+
+        # Preallocated preprocessing buffers, observations alternate between two of them
+        # because the previous observation is still needed for the reward
+        self._obs_buffers = (np.empty((84, 84, 1), dtype=np.uint8),
+                             np.empty((84, 84, 1), dtype=np.uint8))
+        self._obs_index = 0
+        self._resized_bgra = np.empty((84, 84, 4), dtype=np.uint8)
+
+        # Reward thresholds were tuned on the raw BGRA capture, scale them to the observation
+        scale = (84 * 84) / (self.monitor["width"] * self.monitor["height"] * 4)
+        self._reward_thresholds = (500 * scale, 1000 * scale, 1000 * scale, 1000 * scale)
+        # Reward per action for movement (at or below, above) its threshold:
+        # F succeeds when the screen stays calm, D/A/S when the fish pulls
+        self._reward_table = ((10, -5), (-5, 5), (-5, 5), (-5, 5))
+
+        # Capture in the background so a fresh frame is ready after each step's sleep; DXGI
+        # keeps its own ring buffer, the mss fallback grabs one frame per request in our thread
+        self._frames = queue.Queue(maxsize=1)  # Holds only the latest mss frame
+        self._grab_requests = queue.Queue()  # perf_counter() times at which to grab a frame
+        self._frame_requested = False
+        self._capture_stop = threading.Event()
+        self._capture_thread = None
+        self._camera = self._create_camera()
+        if self._camera is None:
+            self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._capture_thread.start()
 
     def reset(self, seed=None, options=None):
         """Reset the environment and return the initial observation."""
         super().reset(seed=seed)
         self.previous_frame = self._get_screen_frame()
         initial_state = self._process_frame(self.previous_frame)
+        self._prev_processed = initial_state
         return initial_state, {}
 
     def step(self, action):
         """Take an action in the environment and return the result."""
         self._perform_action(action)
 
-        # Wait for a short time to let the game respond
-        pyautogui.sleep(0.5)
+        # Wait for a short time to let the game respond, the frame is grabbed as it ends
+        self._request_frame(time.perf_counter() + self._ACTION_DELAY_S)
+        time.sleep(self._ACTION_DELAY_S)
 
         # Get the new game state
         current_frame = self._get_screen_frame()
         processed_frame = self._process_frame(current_frame)
 
         # Calculate reward based on game state changes
-        reward = self._calculate_reward(self.previous_frame, current_frame, action)
+        reward = self._calculate_reward(self._prev_processed, processed_frame, action)
         self.previous_frame = current_frame
+        self._prev_processed = processed_frame
 
         # Determine if the episode is done (e.g., fish caught)
         done = self._check_if_done(current_frame)
 
         return processed_frame, reward, done, False, {}
 
+    def close(self):
+        """Stop the background screen capture."""
+        camera = getattr(self, "_camera", None)
+        if camera is not None:
+            camera.stop()
+            self._camera = None
+        capture_thread = getattr(self, "_capture_thread", None)
+        if capture_thread is not None:
+            self._capture_stop.set()
+            capture_thread.join()
+            self._capture_thread = None
+        super().close()
+
+    def __del__(self):
+        self.close()
+
+    def _create_camera(self):
+        """Start a DXGI Desktop Duplication capture of the monitor region, if available."""
+        if dxcam is None:
+            return None
+        left, top = self.monitor["left"], self.monitor["top"]
+        region = (left, top, left + self.monitor["width"], top + self.monitor["height"])
+        try:
+            # Let DXGI deliver grayscale so no per-pixel color conversion is left for us
+            camera = dxcam.create(output_idx=0, output_color="GRAY")
+            # video_mode repeats the last frame so reads never block on a static screen
+            camera.start(target_fps=60, region=region, video_mode=True)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("DXGI screen capture unavailable, falling back to mss.")
+            return None
+        return camera
+
     def _get_screen_frame(self):
         """Capture the current screen and return it as a NumPy array."""
+        if self._camera is not None:
+            return self._camera.get_latest_frame()
+        if not self._frame_requested:
+            self._request_frame(time.perf_counter())
+        while True:
+            try:
+                frame = self._frames.get(timeout=1)
+                self._frame_requested = False
+                return frame
+            except queue.Empty:
+                # Don't wait forever on a capture thread that died, e.g. without a display
+                if not self._capture_thread.is_alive():
+                    raise RuntimeError("Screen capture thread stopped unexpectedly.") from None
+
+    def _request_frame(self, grab_at):
+        """Ask the mss capture thread for a frame grabbed at the given perf_counter() time."""
+        if self._camera is None:
+            self._grab_requests.put(grab_at)
+            self._frame_requested = True
+
+    def _capture_loop(self):
+        """Grab a frame with mss for each request and keep only the most recent one."""
+        # mss handles are bound to the creating thread, so the instance lives here
         with mss.mss() as sct:
-            frame = np.array(sct.grab(self.monitor))
-        return frame
+            while not self._capture_stop.is_set():
+                try:
+                    grab_at = self._grab_requests.get(timeout=0.25)
+                except queue.Empty:
+                    continue  # Idle between steps, only check whether to stop
+                # Wait out the step's delay here instead of grabbing frames nobody reads
+                wait_for = grab_at - time.perf_counter()
+                if wait_for > 0 and self._capture_stop.wait(wait_for):
+                    break
+                raw = sct.grab(self.monitor)
+                # View the BGRA bytes directly instead of copying them through np.array()
+                frame = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+                try:
+                    self._frames.get_nowait()  # Drop the stale frame
+                except queue.Empty:
+                    pass
+                self._frames.put(frame)
 
     def _process_frame(self, frame):
-        """Convert a screen frame to grayscale and resize it."""
-        gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        resized_frame = cv2.resize(gray_frame, (84, 84))
-        return np.expand_dims(resized_frame, axis=-1)  # Add channel dimension
+        """
+        Resize a gray or BGRA screen frame and convert it to grayscale.
+
+        The result is written into a reused buffer and stays valid until the
+        next-but-one call, callers that keep observations longer must copy them.
+        """
+        observation = self._obs_buffers[self._obs_index]
+        self._obs_index ^= 1
+        if frame.shape[-1] == 4:  # BGRA from mss
+            # Resize first so the color conversion only touches 84x84 pixels
+            cv2.resize(frame, (84, 84), dst=self._resized_bgra, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._resized_bgra, cv2.COLOR_BGRA2GRAY, dst=observation[:, :, 0])
+        else:  # DXGI frames are already gray
+            cv2.resize(frame, (84, 84), dst=observation[:, :, 0], interpolation=cv2.INTER_AREA)
+        return observation
 
     def _perform_action(self, action):
         """Simulate a keypress for the given action."""
-        keys = ['f', 'd', 'a', 's']
-        pyautogui.press(keys[action])
+        self._game.tap_key(self._ACTION_KEYS[action], sleep_after=False)  # step() waits itself
 
     def _calculate_reward(self, previous_frame, current_frame, action):
-        """Calculate the reward based on the change in screen state."""
-        diff = cv2.absdiff(previous_frame, current_frame)
-        movement_change = np.sum(diff)
-
-        # Define rewards/punishments based on game state changes
-        if action == 0:  # F (cast rod or reel in fish)
-            if movement_change < 500:  # Rod casting or reeling in is successful
-                return 10
-            return -5  # Nothing happened
-        if action in [1, 2, 3]:  # D, A, S (reeling directions)
-            if movement_change > 1000:  # Fish pulling in the expected direction
-                return 5
-            return -5  # Wrong action or no movement
-        return 0  # Neutral reward
+        """Calculate the reward based on the change between two processed frames."""
+        movement_change = absdiff_sum(previous_frame, current_frame)
+        moved = movement_change > self._reward_thresholds[action]
+        return self._reward_table[action][moved]
 
     def _check_if_done(self, frame):
         """Check if the fish has been successfully reeled in."""
@@ -11,6 +11,7 @@ Classes:
 """
 
 import ctypes
+import logging
 import random
 import time
 from enum import Enum
@@ -53,6 +54,11 @@ class KeyScancode(Enum):
     BACKSPACE = 0x0E  # Backspace key
 
 
+# Shared dwExtraInfo for all input structures, the value is only passed through by Windows
+_ZERO_EXTRA = ctypes.c_ulong(0)
+_ZERO_EXTRA_PTR = ctypes.pointer(_ZERO_EXTRA)
+
+
 class GameWindowError(Exception):
     """Custom exception raised when the game window is not in the foreground."""
 
@@ -98,13 +104,66 @@ class GameInteraction:
     _MOUSEEVENTF_RIGHTUP = 0x0010
     _KEYEVENTF_SCANCODE = 0x0008
     _KEYEVENTF_KEYUP = 0x0002
+    # Random sleep after input events, as minimum and range in seconds
+    _KEY_SLEEP_MIN_S = 0.200
+    _KEY_SLEEP_RANGE_S = 0.100
+    _KEY_HOLD_SLEEP_MIN_S = 0.050
+    _KEY_HOLD_SLEEP_RANGE_S = 0.050
+    _MOUSE_SLEEP_MIN_S = 0.100
+    _MOUSE_SLEEP_RANGE_S = 0.100
 
     def __init__(self, game_title: str) -> None:
         """Initialize the GameInteraction utility."""
-        self._user32 = ctypes.windll.user32
+        # Own user32 instance so the prototypes below don't leak into ctypes.windll.user32
+        self._user32 = ctypes.WinDLL("user32")
+        self._declare_prototypes()
+        self._send_input_fn = self._user32.SendInput  # Skip the DLL attribute lookup per event
+        self._input_size = ctypes.sizeof(_Input)
         self._set_to_foreground(game_title)
         self._keys_down = set()  # Track keys currently pressed down
 
+        # Case-insensitive scancode lookup without lowering the key on every event
+        self._scancodes = {
+            **{key.upper(): scancode for key, scancode in US_QWERTY_SCANCODES.items()},
+            **US_QWERTY_SCANCODES,
+        }
+
+        # Pre-build the input structures once and reuse them for every event
+        self._key_down_inputs = {
+            scancode: self._create_keyboard_input(scancode, self._KEYEVENTF_SCANCODE)
+            for scancode in US_QWERTY_SCANCODES.values()
+        }
+        self._key_up_inputs = {
+            scancode: self._create_keyboard_input(
+                scancode, self._KEYEVENTF_SCANCODE | self._KEYEVENTF_KEYUP
+            )
+            for scancode in US_QWERTY_SCANCODES.values()
+        }
+        # Key-down followed by key-up, sent together in a single SendInput call
+        self._key_tap_inputs = {
+            scancode: (_Input * 2)(self._key_down_inputs[scancode], self._key_up_inputs[scancode])
+            for scancode in US_QWERTY_SCANCODES.values()
+        }
+        self._mouse_inputs = {
+            flags: self._create_mouse_input(flags)
+            for flags in (self._MOUSEEVENTF_LEFTDOWN, self._MOUSEEVENTF_LEFTUP,
+                          self._MOUSEEVENTF_RIGHTDOWN, self._MOUSEEVENTF_RIGHTUP)
+        }
+        # Button down followed by button up, sent together in a single SendInput call
+        self._left_click_inputs = (_Input * 2)(self._mouse_inputs[self._MOUSEEVENTF_LEFTDOWN],
+                                               self._mouse_inputs[self._MOUSEEVENTF_LEFTUP])
+        self._right_click_inputs = (_Input * 2)(self._mouse_inputs[self._MOUSEEVENTF_RIGHTDOWN],
+                                                self._mouse_inputs[self._MOUSEEVENTF_RIGHTUP])
+
+    def _declare_prototypes(self) -> None:
+        """Declare argtypes/restype of the used user32 functions for fast, correct marshaling."""
+        self._user32.SendInput.argtypes = [ctypes.c_uint, ctypes.POINTER(_Input), ctypes.c_int]
+        self._user32.SendInput.restype = ctypes.c_uint
+        self._user32.FindWindowW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p]
+        self._user32.FindWindowW.restype = ctypes.c_void_p
+        self._user32.SetForegroundWindow.argtypes = [ctypes.c_void_p]
+        self._user32.SetForegroundWindow.restype = ctypes.c_int
+
     def _set_to_foreground(self, game_title: str) -> None:
         """Set the game window to the foreground."""
         hwnd: Optional[int] = self._user32.FindWindowW(None, game_title)
@@ -114,11 +173,11 @@ class GameInteraction:
         if not result:
             raise GameWindowError("Failed to bring the game window to the foreground.")
 
-    def _send_input(self, input_struct: _Input) -> None:
-        """Send input to the game window."""
-        result = self._user32.SendInput(1, ctypes.pointer(input_struct),
-                                        ctypes.sizeof(input_struct))
-        if not result:
+    def _send_input(self, inputs, count: int = 1) -> None:
+        """Send an input structure, or an array of `count` of them at once, to the game window."""
+        # argtypes pass a structure by reference and an array as pointer to its first element
+        result = self._send_input_fn(count, inputs, self._input_size)
+        if result != count:
             raise OSError("Failed to send input to the game window.")
 
     def _hold_key(self, key: str) -> None:
@@ -128,8 +187,9 @@ class GameInteraction:
             return  # Avoid sending a duplicate key-down event
 
         scancode = self._char_to_scancode(key)
-        logger.info("Sending key-down for '%s' with scancode '%s'.", key, scancode)
-        self._send_input(self._create_keyboard_input(scancode, self._KEYEVENTF_SCANCODE))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending key-down for '%s' with scancode '%#04x'.", key, scancode)
+        self._send_input(self._key_down_inputs[scancode])
         self._keys_down.add(key)  # Mark the key as pressed
 
     def hold_key(self, key: str) -> None:
@@ -144,10 +204,9 @@ class GameInteraction:
             return  # Avoid sending a release event for an unpressed key
 
         scancode = self._char_to_scancode(key)
-        logger.info("Sending key-up for '%s' with scancode '%s'.", key, scancode)
-        self._send_input(
-            self._create_keyboard_input(scancode, self._KEYEVENTF_SCANCODE | self._KEYEVENTF_KEYUP)
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending key-up for '%s' with scancode '%#04x'.", key, scancode)
+        self._send_input(self._key_up_inputs[scancode])
         self._keys_down.remove(key)  # Mark the key as released
 
     def release_key(self, key: str) -> None:
@@ -159,10 +218,34 @@ class GameInteraction:
         """Press and release a key in the game."""
         logger.info("Press and release '%s'.", key)
         self._hold_key(key)
-        self._random_sleep_after_key(min_ms=50, max_ms=100)
+        self._random_sleep(self._KEY_HOLD_SLEEP_MIN_S, self._KEY_HOLD_SLEEP_RANGE_S)
         self._release_key(key)
         self._random_sleep_after_key()
 
+    def tap_key(self, key: str, sleep_after: bool = True) -> None:
+        """
+        Press and release a key in the game with a single SendInput call.
+
+        Unlike `press_key`, the key is not held between both events, so use
+        `press_key` for games that only poll the key state once per frame.
+
+        Args:
+            key (str): The key to tap.
+            sleep_after (bool): Sleep the usual random delay after the tap. Callers
+                                that pace their own inputs can skip it.
+        """
+        if key in self._keys_down:
+            logger.info("Key '%s' is already pressed. Ignoring tap_key.", key)
+            return  # A tap would release the held key
+
+        scancode = self._char_to_scancode(key)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending key-down and key-up for '%s' with scancode '%#04x'.",
+                        key, scancode)
+        self._send_input(self._key_tap_inputs[scancode], 2)
+        if sleep_after:
+            self._random_sleep_after_key()
+
     def reset_keys(self) -> None:
         """Release all keys that are currently pressed (for cleanup)."""
         for key in list(self._keys_down):  # Make a copy to avoid modification during iteration
@@ -170,29 +253,27 @@ class GameInteraction:
 
     def left_click(self) -> None:
         """Perform a left mouse click."""
-        self.left_click_down()
-        self.left_click_up()
+        self._send_input(self._left_click_inputs, 2)
 
     def left_click_down(self) -> None:
         """Press the left mouse button down."""
-        self._send_input(self._create_mouse_input(self._MOUSEEVENTF_LEFTDOWN))
+        self._send_input(self._mouse_inputs[self._MOUSEEVENTF_LEFTDOWN])
 
     def left_click_up(self) -> None:
         """Release the left mouse button."""
-        self._send_input(self._create_mouse_input(self._MOUSEEVENTF_LEFTUP))
+        self._send_input(self._mouse_inputs[self._MOUSEEVENTF_LEFTUP])
 
     def right_click(self) -> None:
         """Perform a right mouse click."""
-        self.right_click_down()
-        self.right_click_up()
+        self._send_input(self._right_click_inputs, 2)
 
     def right_click_down(self) -> None:
         """Press the right mouse button down."""
-        self._send_input(self._create_mouse_input(self._MOUSEEVENTF_RIGHTDOWN))
+        self._send_input(self._mouse_inputs[self._MOUSEEVENTF_RIGHTDOWN])
 
     def right_click_up(self) -> None:
         """Release the right mouse button."""
-        self._send_input(self._create_mouse_input(self._MOUSEEVENTF_RIGHTUP))
+        self._send_input(self._mouse_inputs[self._MOUSEEVENTF_RIGHTUP])
 
     @staticmethod
     def _create_keyboard_input(scancode: int, flags: int) -> _Input:
@@ -205,7 +286,7 @@ class GameInteraction:
                     wScan=scancode,
                     dwFlags=flags,
                     time=0,
-                    dwExtraInfo=ctypes.pointer(ctypes.c_ulong(0)),
+                    dwExtraInfo=_ZERO_EXTRA_PTR,
                 )
             ),
         )
@@ -222,13 +303,12 @@ class GameInteraction:
                     mouseData=0,
                     dwFlags=flags,
                     time=0,
-                    dwExtraInfo=ctypes.pointer(ctypes.c_ulong(0)),
+                    dwExtraInfo=_ZERO_EXTRA_PTR,
                 )
             ),
         )
 
-    @staticmethod
-    def _char_to_scancode(key: str) -> int:
+    def _char_to_scancode(self, key: str) -> int:
         """
         Convert a key (character or special) to its scancode using the US QWERTY standard.
 
@@ -241,30 +321,27 @@ class GameInteraction:
         Raises:
             ValueError: If the key cannot be converted.
         """
-        # Convert key to lowercase for consistent matching
-        key = key.lower()
-
-        # Check predefined US-QWERTY scancode map
-        if key in US_QWERTY_SCANCODES:
-            scancode = US_QWERTY_SCANCODES[key]
-            logger.info( "Key '%s' -> scancode `%s', `%#04x'.", key, scancode, scancode)
+        # Check predefined US-QWERTY scancode map, both cases are pre-populated
+        scancode = self._scancodes.get(key)
+        if scancode is not None:
             return scancode
 
         raise ValueError(f"Key '{key}' is not supported in the US-QWERTY scancode map.")
 
     @staticmethod
-    def _random_sleep(min_ms: int, max_ms: int) -> None:
-        """Sleep for a random duration between min_ms and max_ms milliseconds."""
-        duration = random.uniform(min_ms / 1000, max_ms / 1000)  # Convert ms to seconds
-        logger.debug("Sleeping for %.3f.", duration)
+    def _random_sleep(min_s: float, range_s: float) -> None:
+        """Sleep for a random duration between min_s and min_s + range_s seconds."""
+        duration = min_s + random.random() * range_s
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sleeping for %.3f.", duration)
         time.sleep(duration)
 
-    @staticmethod
-    def _random_sleep_after_key(min_ms: int = 200, max_ms: int = 300) -> None:
-        """Sleep for a random duration between min_ms and max_ms milliseconds."""
-        GameInteraction._random_sleep(min_ms, max_ms)
+    @classmethod
+    def _random_sleep_after_key(cls) -> None:
+        """Sleep for a random duration between 200 and 300 milliseconds."""
+        cls._random_sleep(cls._KEY_SLEEP_MIN_S, cls._KEY_SLEEP_RANGE_S)
 
-    @staticmethod
-    def _random_sleep_after_mouse(min_ms: int = 100, max_ms: int = 200) -> None:
-        """Sleep for a random duration between min_ms and max_ms milliseconds."""
-        GameInteraction._random_sleep(min_ms, max_ms)
+    @classmethod
+    def _random_sleep_after_mouse(cls) -> None:
+        """Sleep for a random duration between 100 and 200 milliseconds."""
+        cls._random_sleep(cls._MOUSE_SLEEP_MIN_S, cls._MOUSE_SLEEP_RANGE_S)
@@ -9,7 +9,6 @@ Classes:
     LoggerSetup: A custom logger that configures dynamic names and traceback inclusion.
 """
 
-import inspect
 import logging
 import os
 import sys
@@ -33,18 +32,19 @@ class LoggerSetup(logging.Logger):
 
         Args:
             log_level (Optional[str]): The log level to use. Defaults to the `LOG_LEVEL`
-                                       environment variable, `GLOBAL_LOG_LEVEL`, or NOTSET.
+                                       environment variable, `GLOBAL_LOG_LEVEL` of the
+                                       `__main__` module, or NOTSET.
         """
-        # Get the name of the calling module
-        caller_frame = inspect.stack()[1]
-        module = inspect.getmodule(caller_frame[0])
+        # Get the name of the calling module from its frame only, without unwinding the stack
+        caller_frame = sys._getframe(1)  # pylint: disable=protected-access
+        module_name = caller_frame.f_globals.get("__name__")
 
         # Use module's name, or fallback to filename (if `__main__` detected)
-        if module and module.__name__ != "__main__":
-            logger_name = module.__name__
+        if module_name and module_name != "__main__":
+            logger_name = module_name
         else:
             # Get the file path of the caller
-            file_path = os.path.relpath(caller_frame.filename)
+            file_path = os.path.relpath(caller_frame.f_code.co_filename)
             # Replace the file separators with dots and remove the `.py` extension
             logger_name = file_path.replace(os.path.sep, ".").replace('.py', '')
 
@@ -140,13 +140,12 @@ class LoggerSetup(logging.Logger):
     @staticmethod
     def _get_global_log_level() -> Optional[str]:
         """
-        Dynamically retrieve the global `GLOBAL_LOG_LEVEL` if defined in any importing module.
+        Retrieve the global `GLOBAL_LOG_LEVEL` if defined in the `__main__` module.
+
+        Only the entry-point script is checked, so the lookup is constant-time
+        regardless of how many modules are loaded.
 
         Returns:
             Optional[str]: The value of `GLOBAL_LOG_LEVEL`, or None if not defined.
         """
-        # Check if GLOBAL_LOG_LEVEL exists in globals() of any module
-        for module in sys.modules.values():
-            if module and hasattr(module, "GLOBAL_LOG_LEVEL"):
-                return getattr(module, "GLOBAL_LOG_LEVEL")
-        return None
+        return getattr(sys.modules.get("__main__"), "GLOBAL_LOG_LEVEL", None)
@@ -0,0 +1,63 @@
+"""
+Mixed Precision DQN Module
+
+This module provides a DQN variant that speeds up learning on CUDA GPUs by
+running the Q-network forward passes in BF16 and compiling them with
+`torch.compile` where its backend is available. Observations stay uint8, only
+the network computations change precision.
+
+Classes:
+    MixedPrecisionDQN: DQN with BF16 autocast forward passes and compiled Q-networks on CUDA.
+"""
+
+import functools
+import importlib.util
+import sys
+
+import torch
+from stable_baselines3 import DQN
+
+
+def _bf16_native() -> bool:
+    """Whether the current CUDA device computes BF16 in hardware (Ampere or newer)."""
+    return torch.cuda.is_available() and torch.cuda.get_device_capability() >= (8, 0)
+
+
+def _can_compile() -> bool:
+    """Whether torch.compile's default inductor backend can generate CUDA kernels here."""
+    # Inductor needs Triton on CUDA, which has no official Windows wheels
+    return sys.platform != "win32" and importlib.util.find_spec("triton") is not None
+
+
+def _autocast_forward(module: torch.nn.Module, device_type: str) -> None:
+    """Run the module's forward pass under BF16 autocast, returning float32 outputs."""
+    forward = module.forward
+
+    @functools.wraps(forward)
+    def forward_bf16(*args, **kwargs):
+        with torch.autocast(device_type=device_type, dtype=torch.bfloat16):
+            return forward(*args, **kwargs).float()
+
+    # An instance attribute, so state_dict keys, saving and loading stay unchanged
+    module.forward = forward_bf16
+
+
+class MixedPrecisionDQN(DQN):
+    """
+    DQN that runs its Q-network forward passes under BF16 autocast on CUDA GPUs.
+
+    Only the forward passes are autocast; the loss, backward pass and optimizer
+    step stay in float32. The Q-networks are also compiled where torch.compile
+    can generate kernels. On devices without native BF16 it behaves exactly like
+    DQN. Saved models can be loaded with either class.
+    """
+
+    def _setup_model(self) -> None:
+        """Create the networks, autocasting and compiling them in place when BF16 is used."""
+        super()._setup_model()
+        self._use_bf16 = self.device.type == "cuda" and _bf16_native()
+        if self._use_bf16:
+            for q_net in (self.q_net, self.q_net_target):
+                _autocast_forward(q_net, self.device.type)
+                if _can_compile():
+                    q_net.compile()  # In place, so the module itself is unchanged
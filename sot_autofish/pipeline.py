@@ -0,0 +1,233 @@
+"""
+Fishing Pipeline Module
+
+This module runs screen capture, rod-up detection and game input as concurrent
+threads connected by queues, so the per-frame latency is set by the slowest
+stage instead of the sum of all stages. OpenCV and mss release the GIL while
+working, so the stages really run in parallel.
+
+Classes:
+    CaptureWorker: Thread grabbing frames and publishing only the latest ones.
+    VisionWorker: Thread detecting a reeled-in fish and requesting a key press.
+    InputWorker: Thread sending requested key presses to the game.
+    FishingPipeline: Wires the workers together and controls their lifetime.
+"""
+
+import ctypes
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Optional
+
+import mss
+import numpy as np
+
+from sot_autofish.game_interaction import GameInteraction
+from sot_autofish.logger_setup.logger_setup import LoggerSetup
+from sot_autofish.utils.vision import is_fish_reeled_in
+
+logger = LoggerSetup()
+
+_QUEUE_POLL_S = 0.25  # How often idle workers check whether they should stop
+_FRAME_TIMEOUT_S = 0.25  # Vision state is reset when no frame arrives for this long
+_THREAD_PRIORITY_ABOVE_NORMAL = 1
+
+
+def _put_dropping_oldest(target: queue.Queue, item) -> None:
+    """Put an item into a bounded queue, discarding the oldest entry when it is full."""
+    while True:
+        try:
+            target.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                target.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _available_cores() -> list:
+    """CPU cores the process may run on, restricted by its cpuset where the OS reports one."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count()))
+
+
+def _select_core(index: Optional[int], cores: list, name: str) -> Optional[int]:
+    """Map a core index to an available core, or None (no pinning) when it doesn't exist."""
+    if index is None:
+        return None
+    if index >= len(cores):
+        logger.warning("Core index %d is not available (%d cores), not pinning the %s thread.",
+                       index, len(cores), name)
+        return None
+    return cores[index]
+
+
+def _pin_current_thread(core: int) -> None:
+    """Pin the calling thread to one CPU core and raise its priority to reduce timing jitter."""
+    if sys.platform == "win32":
+        kernel32 = ctypes.WinDLL("kernel32")
+        kernel32.GetCurrentThread.restype = ctypes.c_void_p
+        kernel32.SetThreadAffinityMask.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t
+        kernel32.SetThreadPriority.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        kernel32.SetThreadPriority.restype = ctypes.c_int
+        thread = kernel32.GetCurrentThread()
+        if not kernel32.SetThreadAffinityMask(thread, 1 << core):
+            logger.warning("Failed to pin thread '%s' to core %d.",
+                           threading.current_thread().name, core)
+        if not kernel32.SetThreadPriority(thread, _THREAD_PRIORITY_ABOVE_NORMAL):
+            logger.warning("Failed to raise priority of thread '%s'.",
+                           threading.current_thread().name)
+    elif hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {core})  # 0 is the calling thread on Linux
+        except OSError as e:
+            logger.warning("Failed to pin thread '%s' to core %d: %s",
+                           threading.current_thread().name, core, e)
+
+
+class CaptureWorker(threading.Thread):
+    """Thread grabbing the capture region with mss, never blocking on slower consumers."""
+
+    def __init__(self, monitor: dict, frames: queue.Queue, stop_event: threading.Event,
+                 target_fps: int = 30, core: Optional[int] = None) -> None:
+        super().__init__(name="CaptureWorker", daemon=True)
+        self._monitor = monitor
+        self._frames = frames
+        self._stop_event = stop_event
+        self._interval = 1 / target_fps
+        self._core = core
+
+    def run(self) -> None:
+        if self._core is not None:
+            _pin_current_thread(self._core)
+        # mss handles are bound to the creating thread, so the instance lives here
+        with mss.mss() as sct:
+            next_deadline = time.perf_counter()
+            while not self._stop_event.is_set():
+                raw = sct.grab(self._monitor)
+                frame = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+                _put_dropping_oldest(self._frames, frame)
+                # Wait until the next deadline so variable grab time doesn't drift the rate
+                next_deadline += self._interval
+                wait_for = next_deadline - time.perf_counter()
+                if wait_for > 0:
+                    self._stop_event.wait(wait_for)
+                else:
+                    next_deadline = time.perf_counter()  # Missed it, resync instead of bursting
+
+
+class VisionWorker(threading.Thread):
+    """Thread requesting a key press whenever a reeled-in fish newly appears on screen."""
+
+    def __init__(self, frames: queue.Queue, keys: queue.Queue, stop_event: threading.Event,
+                 key: str = 'f', core: Optional[int] = None) -> None:
+        super().__init__(name="VisionWorker", daemon=True)
+        self._frames = frames
+        self._keys = keys
+        self._stop_event = stop_event
+        self._key = key
+        self._core = core
+
+    def run(self) -> None:
+        if self._core is not None:
+            _pin_current_thread(self._core)
+        reeled_in = False
+        while not self._stop_event.is_set():
+            try:
+                frame = self._frames.get(timeout=_FRAME_TIMEOUT_S)
+            except queue.Empty:
+                if reeled_in:
+                    # Capture stalled, don't let a stale detection suppress the next catch
+                    logger.warning("No frame for %.0f ms, resetting detection.",
+                                   _FRAME_TIMEOUT_S * 1000)
+                    reeled_in = False
+                continue
+            detected = is_fish_reeled_in(frame)
+            if detected and not reeled_in:  # Only react once per catch
+                logger.info("Fish reeled in, requesting '%s'.", self._key)
+                self._keys.put(self._key)
+            reeled_in = detected
+
+
+class InputWorker(threading.Thread):
+    """Thread sending requested key presses to the game."""
+
+    def __init__(self, game: GameInteraction, keys: queue.Queue,
+                 stop_event: threading.Event) -> None:
+        super().__init__(name="InputWorker", daemon=True)
+        self._game = game
+        self._keys = keys
+        self._stop_event = stop_event
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                key = self._keys.get(timeout=_QUEUE_POLL_S)
+            except queue.Empty:
+                continue
+            self._game.press_key(key)
+
+
+class FishingPipeline:
+    """Concurrent capture, vision and input pipeline for automated fishing."""
+
+    def __init__(self, game: GameInteraction, monitor: dict,
+                 capture_core: Optional[int] = 2, vision_core: Optional[int] = 4) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            game (GameInteraction): The game to send inputs to.
+            monitor (dict): The screen region to capture, in mss monitor format.
+            capture_core (Optional[int]): CPU core to pin the capture thread to, None to not pin.
+            vision_core (Optional[int]): CPU core to pin the vision thread to, None to not pin.
+                                         The defaults avoid core 0 and SMT siblings. Both are
+                                         indices into the cores available to the process;
+                                         a thread whose index is not available, or that would
+                                         share the other thread's core, is not pinned.
+        """
+        cores = _available_cores()
+        capture_core = _select_core(capture_core, cores, "capture")
+        vision_core = _select_core(vision_core, cores, "vision")
+        if vision_core is not None and vision_core == capture_core:
+            # Two busy threads on one core would serialize the pipeline, worse than not pinning
+            logger.warning("Capture and vision threads would share core %d, not pinning vision.",
+                           vision_core)
+            vision_core = None
+        self._stop_event = threading.Event()
+        # Single slot holding only the freshest frame, so a slow detector never sees stale ones
+        frames = queue.Queue(maxsize=1)
+        keys = queue.Queue()  # Key presses are never dropped
+        self._workers = (
+            CaptureWorker(monitor, frames, self._stop_event, core=capture_core),
+            VisionWorker(frames, keys, self._stop_event, core=vision_core),
+            InputWorker(game, keys, self._stop_event),
+        )
+
+    def start(self) -> None:
+        """Start all pipeline workers."""
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self) -> None:
+        """Stop all pipeline workers and wait for them to finish."""
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    # Screen capture region (adjust for your monitor/game resolution)
+    pipeline = FishingPipeline(GameInteraction("Sea of Thieves"),
+                               {"top": 100, "left": 100, "width": 800, "height": 600})
+    pipeline.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pipeline.stop()
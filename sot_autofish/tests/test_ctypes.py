@@ -1,45 +1,16 @@
 import ctypes
 import time
 
-USER32 = ctypes.windll.user32
-
-# C struct redefinitions
-PUL = ctypes.POINTER(ctypes.c_ulong)
-
-
-class KeyBdInput(ctypes.Structure):
-    _fields_ = [("wVk", ctypes.c_ushort),
-                ("wScan", ctypes.c_ushort),
-                ("dwFlags", ctypes.c_ulong),
-                ("time", ctypes.c_ulong),
-                ("dwExtraInfo", PUL)]
-
-
-class HardwareInput(ctypes.Structure):
-    _fields_ = [("uMsg", ctypes.c_ulong),
-                ("wParamL", ctypes.c_short),
-                ("wParamH", ctypes.c_ushort)]
-
-
-class MouseInput(ctypes.Structure):
-    _fields_ = [("dx", ctypes.c_long),
-                ("dy", ctypes.c_long),
-                ("mouseData", ctypes.c_ulong),
-                ("dwFlags", ctypes.c_ulong),
-                ("time", ctypes.c_ulong),
-                ("dwExtraInfo", PUL)]
-
-
-class InputI(ctypes.Union):
-    _fields_ = [("ki", KeyBdInput),
-                ("mi", MouseInput),
-                ("hi", HardwareInput)]
-
-
-class Input(ctypes.Structure):
-    _fields_ = [("type", ctypes.c_ulong),
-                ("ii", InputI)]
+# C structs shared with the game interaction module
+from sot_autofish.game_interaction import (  # pylint: disable=protected-access
+    _ZERO_EXTRA_PTR as ZERO_EXTRA_PTR,
+    _Input as Input,
+    _InputI as InputI,
+    _KeyBdInput as KeyBdInput,
+    _MouseInput as MouseInput,
+)
 
+USER32 = ctypes.windll.user32
 
 # Constants for key events
 KEYEVENTF_SCANCODE = 0x0008
@@ -62,34 +33,30 @@ MOUSEEVENTF_RIGHTUP = 0x0010
 
 def press_key(scancode):
     """Press a key using its scancode."""
-    extra = ctypes.c_ulong(0)
     ii_ = InputI()
-    ii_.ki = KeyBdInput(0, scancode, KEYEVENTF_SCANCODE, 0, ctypes.pointer(extra))
+    ii_.ki = KeyBdInput(0, scancode, KEYEVENTF_SCANCODE, 0, ZERO_EXTRA_PTR)
     x = Input(ctypes.c_ulong(1), ii_)
     USER32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
 
 
 def release_key(scancode):
     """Release a key using its scancode."""
-    extra = ctypes.c_ulong(0)
     ii_ = InputI()
-    ii_.ki = KeyBdInput(0, scancode, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
+    ii_.ki = KeyBdInput(0, scancode, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, ZERO_EXTRA_PTR)
     x = Input(ctypes.c_ulong(1), ii_)
     USER32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
 
 def mouse_click_down(button_down):
     """Perform a generic mouse button down action."""
-    extra = ctypes.c_ulong(0)
     ii_ = InputI()
-    ii_.mi = MouseInput(dx=0, dy=0, mouseData=0, dwFlags=button_down, time=0, dwExtraInfo=ctypes.pointer(extra))
+    ii_.mi = MouseInput(dx=0, dy=0, mouseData=0, dwFlags=button_down, time=0, dwExtraInfo=ZERO_EXTRA_PTR)
     x = Input(type=ctypes.c_ulong(0), ii=ii_)
     USER32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
 
 def mouse_click_up(button_up):
     """Perform a generic mouse button up action."""
-    extra = ctypes.c_ulong(0)
     ii_ = InputI()
-    ii_.mi = MouseInput(dx=0, dy=0, mouseData=0, dwFlags=button_up, time=0, dwExtraInfo=ctypes.pointer(extra))
+    ii_.mi = MouseInput(dx=0, dy=0, mouseData=0, dwFlags=button_up, time=0, dwExtraInfo=ZERO_EXTRA_PTR)
     x = Input(type=ctypes.c_ulong(0), ii=ii_)
     USER32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
 
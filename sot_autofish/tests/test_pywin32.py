@@ -1,8 +1,12 @@
+import ctypes
 import win32gui
 import win32api
 import win32con
 import time
 
+# 1 ms system timer resolution instead of the default ~15.6 ms, for the short sleeps below
+TIMER_RESOLUTION_MS = 1
+
 
 def send_key(hwnd, key):
     """Send a key press to the target window."""
@@ -22,7 +26,7 @@ def send_mouse_click(hwnd, x, y, button="left"):
         win32api.PostMessage(hwnd, win32con.WM_RBUTTONUP, 0, lParam)
 
 
-if __name__ == "__main__":
+def main():
     # Replace with the window title of your game
     hwnd = win32gui.FindWindow(None, "Sea of Thieves")
     if hwnd:
@@ -40,3 +44,11 @@ if __name__ == "__main__":
         send_mouse_click(hwnd, x=400, y=500, button="right")
     else:
         print("Window not found.")
+
+
+if __name__ == "__main__":
+    ctypes.windll.winmm.timeBeginPeriod(TIMER_RESOLUTION_MS)
+    try:
+        main()
+    finally:
+        ctypes.windll.winmm.timeEndPeriod(TIMER_RESOLUTION_MS)
@@ -1,15 +1,46 @@
 import mss
+import mss.tools
+import numpy as np
+import queue
+import threading
 import time
 
-def capture_screenshots(interval=1, output_folder="screenshots"):
+def write_screenshots(writer_q):
+    """Encode and write queued screenshots as PNG, off the capture loop."""
+    while True:
+        filename, raw = writer_q.get()
+        try:
+            mss.tools.to_png(raw.rgb, raw.size, output=filename)
+        except Exception as e:
+            # Keep draining the queue, a dead writer would block the capture loop forever
+            print(f"Failed to write {filename}: {e}")
+            continue
+        print(f"Captured {filename}")
+
+def capture_screenshots(interval=1, output_folder="screenshots", save=True):
+    # Bounded so a slow disk applies backpressure instead of piling up frames in memory
+    writer_q = queue.Queue(maxsize=4)
+    if save:
+        threading.Thread(target=write_screenshots, args=(writer_q,), daemon=True).start()
     with mss.mss() as sct:
         monitor = sct.monitors[1]  # Capture primary monitor
         count = 0
+        next_deadline = time.perf_counter()
         while True:
-            filename = f"{output_folder}/screenshot_{count:04d}.png"
-            sct.shot(mon=1, output=filename)
-            print(f"Captured {filename}")
+            raw = sct.grab(monitor)
+            if save:
+                writer_q.put((f"{output_folder}/screenshot_{count:04d}.png", raw))
+            else:
+                # View the BGRA pixels as a NumPy array without copying them
+                frame = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+                print(f"Captured frame {count} with shape {frame.shape}")
             count += 1
-            time.sleep(interval)
+            # Sleep until the next deadline so variable grab/save time doesn't drift the rate
+            next_deadline += interval
+            sleep_for = next_deadline - time.perf_counter()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_deadline = time.perf_counter()  # Missed it, resync instead of bursting
 
 capture_screenshots()
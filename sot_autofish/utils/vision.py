@@ -1,6 +1,146 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
 import cv2
+import numpy as np
+
+from sot_autofish.logger_setup.logger_setup import LoggerSetup
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional, Python's built-in hash is used as a fallback
+    xxhash = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, NumPy's max is used as a fallback
+    njit = None
+
+logger = LoggerSetup()
+
+
+def _check_simd_support():
+    """Fail fast if OpenCV would run matchTemplate without its vectorized code paths."""
+    cv2.setUseOptimized(True)
+    build_info = cv2.getBuildInformation()
+    baseline = re.search(r"^\s*Baseline:(.*)$", build_info, re.MULTILINE)
+    dispatched = re.search(r"^\s*Dispatched code generation:(.*)$", build_info, re.MULTILINE)
+    baseline = baseline.group(1).strip() if baseline else ""
+    dispatched = dispatched.group(1).strip() if dispatched else ""
+    if not cv2.useOptimized() or not (baseline or dispatched):
+        raise RuntimeError("OpenCV was built without SIMD support, template matching would "
+                           "run scalar. Install an official opencv-python wheel.")
+    logger.info("OpenCV SIMD baseline: '%s', dispatched: '%s'.", baseline, dispatched)
+
+
+_check_simd_support()
+
+# Mean-centered correlation, so flat or noisy regions of similar brightness don't match
+_MATCH_METHOD = cv2.TM_CCOEFF_NORMED
+_MATCH_THRESHOLD = 0.8
+
+# Frame region (y0, y1, x0, x1) showing the rod indicator, adjust for your game resolution
+_ROD_UP_ROI = (380, 580, 580, 780)
+# Reused single-channel buffer holding the green channel of BGRA frames
+_GRAY_BUF = np.empty((_ROD_UP_ROI[1] - _ROD_UP_ROI[0], _ROD_UP_ROI[3] - _ROD_UP_ROI[2]),
+                     dtype=np.uint8)
+# The indicator is large and low-frequency, so ROI and template are matched at half resolution
+_HALF_BUF = np.empty(((_GRAY_BUF.shape[0] + 1) // 2, (_GRAY_BUF.shape[1] + 1) // 2),
+                     dtype=np.uint8)
+
+# Decode the template once instead of re-reading the PNG for every frame
+_ROD_UP_TEMPLATE = cv2.imread("rod_up_template.png", cv2.IMREAD_COLOR)
+if _ROD_UP_TEMPLATE is None:
+    raise FileNotFoundError("Template image 'rod_up_template.png' could not be loaded.")
+# Same green channel as taken from BGRA frames, so both sides of the match agree
+_ROD_UP_TEMPLATE = cv2.pyrDown(np.ascontiguousarray(_ROD_UP_TEMPLATE[:, :, 1]))
+
+# Preallocated match result for the fixed ROI size, reused for every frame
+_RES_BUF = np.empty((_HALF_BUF.shape[0] - _ROD_UP_TEMPLATE.shape[0] + 1,
+                     _HALF_BUF.shape[1] - _ROD_UP_TEMPLATE.shape[1] + 1), dtype=np.float32)
+
+# Match on the GPU when OpenCV was built with CUDA, keeping template and buffers on the device
+_USE_CUDA = hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+if _USE_CUDA:
+    _MATCHER = cv2.cuda.createTemplateMatching(cv2.CV_8UC1, _MATCH_METHOD)
+    _TEMPLATE_GPU = cv2.cuda_GpuMat()
+    _TEMPLATE_GPU.upload(_ROD_UP_TEMPLATE)
+    _FRAME_GPU = cv2.cuda_GpuMat()
+    _RESULT_GPU = cv2.cuda_GpuMat()
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _any_above(arr, threshold):
+        """Return as soon as one result is above the threshold instead of scanning all."""
+        flat = arr.ravel()
+        for i in range(flat.size):
+            if flat[i] > threshold:
+                return True
+        return False
+else:
+    def _any_above(arr, threshold):
+        """Check whether any result is above the threshold."""
+        return arr.max() > threshold
+
+
+@dataclass
+class _LastMatch:
+    """Fingerprint of the last matched ROI and its result."""
+    fingerprint: Optional[int] = None
+    result: bool = False
+
+
+_LAST_MATCH = _LastMatch()
+
 
 def is_fish_reeled_in(frame):
-    template = cv2.imread("rod_up_template.png", 0)
-    res = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
-    return np.max(res) > 0.8  # Match threshold
+    """
+    Check whether the rod-up indicator is visible in a BGRA or single-channel frame.
+
+    The template is matched on its green channel. BGRA frames are reduced to green as
+    well, single-channel frames, (H, W) or (H, W, 1) as returned by DXGI, are used as
+    given and should hold the green channel too.
+    """
+    # Only search the small region where the indicator appears instead of the whole frame
+    y0, y1, x0, x1 = _ROD_UP_ROI
+    frame = frame[y0:y1, x0:x1]
+    if frame.ndim == 3 and frame.shape[-1] >= 3:
+        # A plain channel copy instead of cvtColor's weighted sum and fresh allocation
+        np.copyto(_GRAY_BUF, frame[:, :, 1])
+        frame = _GRAY_BUF
+    elif frame.ndim == 3:
+        frame = frame[:, :, 0]  # Drop the trailing singleton channel
+
+    # The UI is often static between frames, an unchanged ROI can't change the result
+    fingerprint = _fingerprint(frame)
+    if fingerprint == _LAST_MATCH.fingerprint:
+        return _LAST_MATCH.result
+    result = _match_rod_up(frame)
+    _LAST_MATCH.fingerprint = fingerprint
+    _LAST_MATCH.result = result
+    return result
+
+
+def _fingerprint(roi) -> int:
+    """Cheap 64-bit hash of the ROI pixels."""
+    data = np.ascontiguousarray(roi)
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return hash(data.tobytes())
+
+
+def _match_rod_up(roi) -> bool:
+    """Match the rod-up template against a grayscale ROI."""
+    frame = cv2.pyrDown(roi, dst=_HALF_BUF)
+    if _USE_CUDA:
+        _FRAME_GPU.upload(frame)
+        _MATCHER.match(_FRAME_GPU, _TEMPLATE_GPU, _RESULT_GPU)
+        # Reduce on the device instead of downloading the whole result
+        _, max_val, _, _ = cv2.cuda.minMaxLoc(_RESULT_GPU)
+        return max_val > _MATCH_THRESHOLD
+    # matchTemplate already correlates through a DFT once the template is large enough
+    res = cv2.matchTemplate(frame, _ROD_UP_TEMPLATE, _MATCH_METHOD, _RES_BUF)
+    return bool(_any_above(res, _MATCH_THRESHOLD))
+